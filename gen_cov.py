@@ -1,15 +1,25 @@
 # Updated generator that writes times.js and loads it from function.html
 import os
+import gzip
 import json
 import argparse
+import re
 import shutil
 import urllib.parse
 from pathlib import Path
+from typing import Optional
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from jinja2 import Template
 import hashlib
 import itertools
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 INDEX_HTML_TEMPLATE1 = """
 <!DOCTYPE html>
 <html>
@@ -43,14 +53,45 @@ INDEX_HTML_TEMPLATE1 = """
 </div>
 
 <script>
-const snapshots = {{ snapshots_json | safe }};
 const times = {{ times | safe }};
+const SNAPSHOT_CACHE_SIZE = 32;
+const snapshotCache = new Map();
 let dataTable;
 let currentPage = 0;
 let currentLength = 25;
+let currentIdx = 0;
+
+function fetchSnapshot(idx) {
+    let snapshot = snapshotCache.get(idx);
+    if (snapshot) {
+        // Move to the back so the least recently used entry is evicted first
+        snapshotCache.delete(idx);
+    } else {
+        snapshot = fetch("snapshots/" + times[idx] + ".json")
+            .then(resp => resp.json())
+            .catch(err => {
+                snapshotCache.delete(idx);
+                throw err;
+            });
+    }
+    snapshotCache.set(idx, snapshot);
+    if (snapshotCache.size > SNAPSHOT_CACHE_SIZE) {
+        snapshotCache.delete(snapshotCache.keys().next().value);
+    }
+    return snapshot;
+}
 
 function loadSnapshot(idx) {
-    const snapshot = snapshots[idx];
+    currentIdx = idx;
+    fetchSnapshot(idx).then(snapshot => {
+        // Ignore responses for positions the slider has already left
+        if (idx === currentIdx) renderSnapshot(idx, snapshot);
+    });
+    if (idx > 0) fetchSnapshot(idx - 1);
+    if (idx < times.length - 1) fetchSnapshot(idx + 1);
+}
+
+function renderSnapshot(idx, snapshot) {
     if (!snapshot || snapshot.length === 0) {
         if (dataTable) {
             dataTable.clear();
@@ -78,7 +119,7 @@ function loadSnapshot(idx) {
     // Add new data
     snapshot.forEach(fn => {
         if (!fn || !fn.name) return;
-        const nameLink = `<a href="function.html?name=${encodeURIComponent(fn.name)}&t=${times[idx]}">${fn.name}</a>`;
+        const nameLink = `<a href="function.html?name=${fn.safe}&t=${times[idx]}">${fn.name}</a>`;
         dataTable.row.add([
             nameLink,
             fn.num_blocks,
@@ -105,6 +146,9 @@ window.addEventListener('DOMContentLoaded', () => {
 </html>
 """
 
+# Compiled once at import instead of on every report
+INDEX_TEMPLATE1 = Template(INDEX_HTML_TEMPLATE1)
+
 FUNCTION_HTML_TEMPLATE1 = """
 <!DOCTYPE html>
 <html>
@@ -143,85 +187,105 @@ if (currentIndex === -1) currentIndex = 0;
 slider.value = currentIndex;
 label.textContent = times[currentIndex];
 
+const LAYOUT = {
+    name: 'dagre',
+    rankDir: 'TB',
+    nodeSep: 70,
+    edgeSep: 30,
+    rankSep: 100
+};
+let cy = null;
+let latestLoad = 0;
+
+// Graphs are stored gzipped, decompress them unless the server already did
+async function fetchGzipJson(url) {
+    const buf = new Uint8Array(await (await fetch(url)).arrayBuffer());
+    if (buf[0] !== 0x1f || buf[1] !== 0x8b) {
+        return JSON.parse(new TextDecoder().decode(buf));
+    }
+    const stream = new Blob([buf]).stream().pipeThrough(new DecompressionStream("gzip"));
+    return new Response(stream).json();
+}
+
 function loadGraph(name, t) {
+    const load = ++latestLoad;
     const graphDir = "graphs/" + t + "/";
-    const nameMapUrl = graphDir + "name_map.json";
-    fetch(nameMapUrl)
+    fetch(graphDir + "name_to_hash.json")
         .then(resp => resp.json())
-        .then(nameMap => {
-            // Find the hash for this function name
-            let hash = null;
-            for (const [h, original] of Object.entries(nameMap)) {
-                if (original === name) {
-                    hash = h;
-                    break;
-                }
-            }
+        .then(nameToHash => {
+            const hash = Object.hasOwn(nameToHash, name) ? nameToHash[name] : null;
             if (!hash) {
                 alert("Function not found in mapping!");
                 throw new Error("Function not found in mapping");
             }
-            return fetch(graphDir + hash + ".json");
+            return fetchGzipJson(graphDir + hash + ".json.gz");
         })
-        .then(response => response.json())
         .then(data => {
+            // A newer timestamp was requested while this one loaded
+            if (load !== latestLoad) return;
             document.getElementById("title").innerText = name + " @ t=" + t;
-            cytoscape({
-                container: document.getElementById('cy'),
-                elements: data,
-                layout: {
-                    name: 'dagre',
-                    rankDir: 'TB',
-                    nodeSep: 70,
-                    edgeSep: 30,
-                    rankSep: 100
-                },
-                style: [
-                    {
-                        selector: 'node',
-                        style: {
-                            'label': 'data(label)',
-                            'background-color': '#0074D9',
-                            'color': '#fff',
-                            'text-valign': 'center',
-                            'text-halign': 'center',
-                            'text-wrap': 'wrap',
-                            'text-max-width': 80,
-                            'font-size': '10px',
-                            'padding': '6px',
-                            'shape': 'roundrectangle',
-                            'width': 'label',
-                            'height': 'label'
-                        }
-                    },
-                    {
-                        selector: 'node[execs = 0]',
-                        style: {
-                            'background-color': '#cccccc', // light gray
-                            'color': '#333',
-                            'border-color': '#999'
+            if (!cy) {
+                cy = cytoscape({
+                    container: document.getElementById('cy'),
+                    elements: data,
+                    layout: LAYOUT,
+                    style: [
+                        {
+                            selector: 'node',
+                            style: {
+                                'label': ele => 'Block ' + ele.data('id') + '\\nExecs: ' + ele.data('execs'),
+                                'background-color': '#0074D9',
+                                'color': '#fff',
+                                'text-valign': 'center',
+                                'text-halign': 'center',
+                                'text-wrap': 'wrap',
+                                'text-max-width': 80,
+                                'font-size': '10px',
+                                'padding': '6px',
+                                'shape': 'roundrectangle',
+                                'width': 'label',
+                                'height': 'label'
+                            }
+                        },
+                        {
+                            selector: 'node[execs = 0]',
+                            style: {
+                                'background-color': '#cccccc', // light gray
+                                'color': '#333',
+                                'border-color': '#999'
+                            }
+                        },
+                        {
+                            selector: 'edge',
+                            style: {
+                                'width': 2,
+                                'line-color': '#ccc',
+                                'target-arrow-shape': 'triangle',
+                                'target-arrow-color': '#ccc',
+                                'curve-style': 'bezier'
+                            }
                         }
-                    },
-                    {
-                        selector: 'edge',
-                        style: {
-                            'width': 2,
-                            'line-color': '#ccc',
-                            'target-arrow-shape': 'triangle',
-                            'target-arrow-color': '#ccc',
-                            'curve-style': 'bezier'
-                        }
-                    }
-                ]
-            });
+                    ]
+                });
+            } else {
+                // Reuse the instance so styles are not recompiled on every tick
+                cy.batch(() => {
+                    cy.elements().remove();
+                    cy.add(data);
+                });
+                cy.layout(LAYOUT).run();
+            }
         });
 }
 
+let sliderTimer = null;
 slider.addEventListener("input", () => {
     const idx = parseInt(slider.value);
     const newTime = times[idx];
     label.textContent = newTime;
-    loadGraph(name, newTime);
+    // Coalesce the ticks fired while the slider is dragged
+    clearTimeout(sliderTimer);
+    sliderTimer = setTimeout(() => loadGraph(name, newTime), 150);
 });
 
 window.addEventListener("DOMContentLoaded", () => {
@@ -288,203 +352,371 @@ th, td {
 }
 """
 
+# Characters quote() never escapes, names made only of these come back unchanged
+UNRESERVED_NAME = re.compile(r"[A-Za-z0-9_.~-]+").fullmatch
+
+@lru_cache(maxsize=None)
 def safe_filename(name: str) -> str:
+    if UNRESERVED_NAME(name):
+        return name
     return urllib.parse.quote(name, safe="")
 
+# Function names repeat in every snapshot, only hash each one once
+@lru_cache(maxsize=None)
 def hash_name(name: str) -> str:
-    return hashlib.sha1(name.encode('utf-8')).hexdigest()
-
-def generate_time_series_report(input_dir: str, output_dir: str):
+    return hashlib.blake2b(name.encode('utf-8'), digest_size=20).hexdigest()
+
+def json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def write_file(path: Path, data: bytes):
+    # Plain fd write, skipping the file object layers for the many small graph files
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def write_if_changed(path: Path, data: bytes):
+    # Leave unchanged boilerplate untouched so browsers can keep their cached copy
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return
+    except FileNotFoundError:
+        pass
+    write_file(path, data)
+
+GZIP_LEVEL = 6
+# Threads used to overlap graph file writes with building the next graph, shared by all worker processes
+WRITER_THREADS = min(32, (os.cpu_count() or 1) * 4)
+
+def write_payload(path: Path, data: bytes, compress: bool = False):
+    # Replace rather than truncate, the old file may be hardlinked from another snapshot
+    path.unlink(missing_ok=True)
+    if compress:
+        data = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    write_file(path, data)
+
+SNAPSHOT_PREFIX = "fun_coverage_"
+
+def list_snapshot_files(input_path: Path) -> list[tuple[int, str]]:
+    # Parse the timestamp once per file instead of on every sort comparison
+    files = []
+    for entry in os.scandir(input_path):
+        name = entry.name
+        if name.startswith(SNAPSHOT_PREFIX) and name.endswith(".json"):
+            files.append((int(name[len(SNAPSHOT_PREFIX):-len(".json")]), entry.path))
+    files.sort()
+    return files
+
+def try_link(src: Path, dst: Path) -> bool:
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        return False
+    return True
+
+def remove_stale(directory: Path, keep: set[str]):
+    for entry in os.scandir(directory):
+        if entry.name in keep:
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+# Cached graphs are only trusted if they were produced by this exact script
+GENERATOR_DIGEST = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+def load_graph_cache(path: Path, report: str) -> dict:
+    try:
+        cache = json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if cache.get("generator") != GENERATOR_DIGEST or cache.get("report") != report:
+        return {}
+    return cache["graphs"]
+
+def file_fingerprint(path: Path) -> Optional[list]:
+    # Files are replaced rather than rewritten, so a different writer leaves a different inode
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_ino, st.st_size, st.st_mtime_ns]
+
+def split_batches(items: list, n: int) -> list[list]:
+    size = max(1, -(-len(items) // n))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+# Block ids are ints, so graph elements can be formatted directly instead of going through the encoder
+NODE_JSON = b'{"data":{"id":"%d","execs":%d}}'
+EDGE_JSON = b'{"data":{"source":"%d","target":"%d"}}'
+
+def process_snapshot(time: int, file: str, output_path: Path, prev_graphs: dict, writer: ThreadPoolExecutor):
+    with open(file, "rb") as f:
+        data = json_loads(f.read())
+    snapshot_summary = []
+    time_dir = output_path / "graphs" / str(time)
+    cache_path = output_path / ".cache" / f"{time}.json"
+    cache = load_graph_cache(cache_path, "time-series")
+    # Drop the cache before touching the graphs, an interrupted run must not leave it describing old files
+    cache_path.unlink(missing_ok=True)
+    time_dir.mkdir(parents=True, exist_ok=True)
+    new_cache = {}
+    name_map = {}
+    pending = []
+    for fn in data:
+        if not fn["unique_blocks"]:
+            # Nothing to draw, leave it out of the graphs and the summary
+            continue
+        name = fn["name"]
+        h = hash_name(name)
+        graph_path = time_dir / f"{h}.json.gz"
+        digest = hashlib.blake2b(json_dumps([fn["unique_blocks"], fn["unique_edges"]]), digest_size=16).hexdigest()
+        cached = cache.get(h)
+        prev = prev_graphs.get(name)
+        edge_state = None
+        if cached is not None and cached[0] == digest and cached[3] == file_fingerprint(graph_path):
+            # Unchanged since the last run, keep the file on disk
+            num_blocks, num_edges = cached[1], cached[2]
+        elif prev is not None and prev[0] == digest and try_link(prev[1], graph_path):
+            # Same blocks and edges as the previous snapshot, reuse its file
+            num_blocks, num_edges = prev[2], prev[3]
+            edge_state = prev[4]
+        else:
+            unique_blocks = fn["unique_blocks"]
+            unique_edges = fn["unique_edges"]
+            # The label is built client side from id and execs
+            nodes = [NODE_JSON % (bid, count) for bid, count in unique_blocks]
+            bids = {bid for bid, _count in unique_blocks}
+            num_blocks = sum(1 for _bid, count in unique_blocks if count > 0)
+            prev_edges = prev[4] if prev is not None else None
+            if prev_edges is not None and prev_edges[1] == unique_edges and prev_edges[0] == bids:
+                # Only the execution counts moved, the filtered edges are the same as before
+                edges = prev_edges[2]
+            else:
+                edges = [EDGE_JSON % (src, dst) for src, dst in unique_edges if src in bids and dst in bids]
+
+            # nodes is fresh for this graph, extend it rather than building a concatenated copy
+            nodes.extend(edges)
+            payload = b"[" + b",".join(nodes) + b"]"
+            pending.append(writer.submit(write_payload, graph_path, payload, True))
+            num_edges = len(edges)
+            edge_state = (bids, unique_edges, edges)
+        prev_graphs[name] = (digest, graph_path, num_blocks, num_edges, edge_state)
+        new_cache[h] = [digest, num_blocks, num_edges]
+        name_map[h] = name
+
+        snapshot_summary.append({
+            "name": name,
+            # URL-encoded once here so the index does not encode every row on each slider move
+            "safe": safe_filename(name),
+            "num_blocks": num_blocks,
+            "num_edges": num_edges,
+            "execs": fn["nums_executed"]
+        })
+    # The next snapshot may hardlink these files, so they must be complete
+    for future in pending:
+        future.result()
+    for h, entry in new_cache.items():
+        entry.append(file_fingerprint(time_dir / f"{h}.json.gz"))
+    # Write the mapping file for this snapshot
+    write_if_changed(time_dir / "name_map.json", json_dumps(name_map))
+    # The viewer looks graphs up by name, spare it a scan of name_map
+    write_if_changed(time_dir / "name_to_hash.json", json_dumps({name: h for h, name in name_map.items()}))
+    remove_stale(time_dir, {f"{h}.json.gz" for h in name_map} | {"name_map.json", "name_to_hash.json"})
+    write_if_changed(output_path / "snapshots" / f"{time}.json", json_dumps(snapshot_summary))
+    write_if_changed(cache_path, json_dumps({"generator": GENERATOR_DIGEST, "report": "time-series", "graphs": new_cache}))
+    return time
+
+def process_snapshots(files: list[tuple[int, str]], output_path: Path, writer_threads: int):
+    # Snapshots in a batch are handled in order so unchanged graphs can be linked
+    prev_graphs = {}
+    with ThreadPoolExecutor(max_workers=writer_threads) as writer:
+        return [process_snapshot(time, file, output_path, prev_graphs, writer) for time, file in files]
+
+def generate_time_series_report(input_dir: str, output_dir: str, jobs: Optional[int] = None):
     input_path = Path(input_dir)
     output_path = Path(output_dir)
     graph_dir = output_path / "graphs"
+    snapshot_dir = output_path / "snapshots"
+    cache_dir = output_path / ".cache"
     css_dir = output_path / "css"
 
-    if output_path.exists():
-        shutil.rmtree(output_path)
-    output_path.mkdir()
-    graph_dir.mkdir()
-    css_dir.mkdir()
-
-    snapshots = []
-    times = []
-
-    all_files = sorted(
-        input_path.glob("fun_coverage_*.json"),
-        key=lambda f: int(f.stem.split("_")[-1])
-    )
-
-    for file in all_files:
-        time = int(file.stem.split("_")[-1])
-        with open(file) as f:
-            data = json.load(f)
-        snapshot_summary = []
-        time_dir = graph_dir / str(time)
-        time_dir.mkdir(parents=True, exist_ok=True)
-        name_map = {}
-        for fn in data:
-            name = fn["name"]
-            h = hash_name(name)
-            block_exec_map = {bid: count for bid, count in fn["unique_blocks"]}
-            covered_blocks = set(block_exec_map.keys())
-
-            nodes = [{
-                "data": {
-                    "id": str(bid),
-                    "label": f"Block {bid}\nExecs: {block_exec_map[bid]}",
-                    "execs": int(block_exec_map[bid])
-                }
-            } for bid in covered_blocks]
-            edges = [{"data": {"source": str(src), "target": str(dst)}} for src, dst in fn["unique_edges"] if src in covered_blocks and dst in covered_blocks]
-
-            (time_dir / f"{h}.json").write_text(json.dumps(nodes + edges, indent=2))
-            name_map[h] = name
-
-            snapshot_summary.append({
-                "name": name,
-                "num_blocks": sum(1 for count in block_exec_map.values() if count > 0),
-                "num_edges": len(edges),
-                "execs": fn["nums_executed"]
-            })
-        # Write the mapping file for this snapshot
-        (time_dir / "name_map.json").write_text(json.dumps(name_map, indent=2, ensure_ascii=False))
-
-        snapshots.append(snapshot_summary)
-        times.append(time)
-
-    (output_path / "index.html").write_text(Template(INDEX_HTML_TEMPLATE1).render(
-        snapshots_json=json.dumps(snapshots, ensure_ascii=False),
+    # Regenerate in place so graphs that did not change since the last run are kept
+    for directory in (output_path, graph_dir, snapshot_dir, cache_dir, css_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+    # Anything else was left by another report type
+    remove_stale(output_path, {"graphs", "snapshots", ".cache", "css", "index.html", "function.html", "times.js"})
+
+    all_files = list_snapshot_files(input_path)
+
+    batches = split_batches(all_files, jobs or os.cpu_count() or 1)
+    # gzip is CPU bound, split the writer threads between the worker processes
+    writer_threads = max(1, WRITER_THREADS // max(1, len(batches)))
+    with ProcessPoolExecutor(max_workers=len(batches) or None) as executor:
+        times = list(itertools.chain.from_iterable(
+            executor.map(process_snapshots, batches, itertools.repeat(output_path), itertools.repeat(writer_threads))
+        ))
+    remove_stale(graph_dir, {str(time) for time in times})
+    for directory in (snapshot_dir, cache_dir):
+        remove_stale(directory, {f"{time}.json" for time in times})
+
+    write_if_changed(output_path / "index.html", INDEX_TEMPLATE1.render(
         times=times,
         max_idx=len(times) - 1
-    ))
-    (output_path / "function.html").write_text(FUNCTION_HTML_TEMPLATE1)
-    (css_dir / "style.css").write_text(STYLE_CSS)
-    (output_path / "times.js").write_text("const times = " + json.dumps(times) + ";")
+    ).encode())
+    write_if_changed(output_path / "function.html", FUNCTION_HTML_TEMPLATE1.encode())
+    write_if_changed(css_dir / "style.css", STYLE_CSS.encode())
+    write_if_changed(output_path / "times.js", b"const times = " + json_dumps(times) + b";")
     print(f"✅ Time-series report generated at: {output_path.resolve()}")
 
-def generate_comparison_report(input_dirs: list[str], output_dir: str):
+COMPARISON_NODE_JSON = b'{"data":{"id":"%d","label":"Block %d\\nExecs: %d / %d","execs0":%d,"execs1":%d,"color":"%s"}}'
+COMPARISON_EDGE_JSON = b'{"data":{"source":"%d","target":"%d","color":"%s"}}'
+
+def process_comparison_snapshot(time1: int, file1: str, time2: int, file2: str, output_path: Path, prev_graphs: dict, writer: ThreadPoolExecutor):
+    if time1 != time2:
+        print(f"Error: Timestamp mismatch between files: {time1} != {time2}", file=sys.stderr)
+    with open(file1, "rb") as f1:
+        data1 = json_loads(f1.read())
+    with open(file2, "rb") as f2:
+        data2 = json_loads(f2.read())
+
+    # convert data1 and data2 to dicts of name -> fn
+    data1 = {fn["name"]: fn for fn in data1}
+    data2 = {fn["name"]: fn for fn in data2}
+
+    snapshot_summary = []
+    time_dir = output_path / "graphs" / str(time1)
+    time_dir.mkdir(parents=True, exist_ok=True)
+    name_map = {}
+    pending = []
+    names = data1.keys() | data2.keys()
+    for name in names:
+        h = hash_name(name)
+        fn1 = data1.get(name)
+        fn2 = data2.get(name)
+        graph_path = time_dir / f"{h}.json.gz"
+        digest = hashlib.blake2b(json_dumps([
+            [fn["unique_blocks"], fn["unique_edges"], fn["hyper_edges"]] if fn is not None else None
+            for fn in (fn1, fn2)
+        ]), digest_size=16).hexdigest()
+        prev = prev_graphs.get(name)
+        if prev is not None and prev[0] == digest and try_link(prev[1], graph_path):
+            # Same blocks and edges on both sides as the previous snapshot, reuse its file
+            counts = prev[2]
+        else:
+            # Merge both block lists in one pass, counting covered blocks on the way
+            block_exec_map = {}
+            num_blocks0 = num_blocks1 = 0
+            if fn1 is not None:
+                for bid, count in fn1["unique_blocks"]:
+                    block_exec_map[bid] = [count, 0]
+                    if count > 0:
+                        num_blocks0 += 1
+            if fn2 is not None:
+                for bid, count in fn2["unique_blocks"]:
+                    block_exec_map.setdefault(bid, [0, 0])[1] = count
+                    if count > 0:
+                        num_blocks1 += 1
+
+            nodes = []
+            for bid, (execs0, execs1) in block_exec_map.items():
+                if execs0 == 0:
+                    color = b"#808080" if execs1 == 0 else b"#2ECC40"
+                elif execs1 == 0:
+                    color = b"#FF4136"
+                else:
+                    color = b"#0000FF"
+                nodes.append(COMPARISON_NODE_JSON % (bid, bid, execs0, execs1, execs0, execs1, color))
+            edges1 = { (src, dst) for src, dst in fn1["unique_edges"] if src in block_exec_map and dst in block_exec_map } if fn1 else set()
+            edges1.update({ (src, dst) for src, dst in fn1["hyper_edges"] if src in block_exec_map and dst in block_exec_map } if fn1 else set())
+            edges2 = { (src, dst) for src, dst in fn2["unique_edges"] if src in block_exec_map and dst in block_exec_map } if fn2 else set()
+            edges2.update({ (src, dst) for src, dst in fn2["hyper_edges"] if src in block_exec_map and dst in block_exec_map } if fn2 else set())
+            nodes.extend([COMPARISON_EDGE_JSON % (src, dst, b"#FF4136") for src, dst in edges1 - edges2])
+            nodes.extend([COMPARISON_EDGE_JSON % (src, dst, b"#2ECC40") for src, dst in edges2 - edges1])
+            nodes.extend([COMPARISON_EDGE_JSON % (src, dst, b"#0074D9") for src, dst in edges1 & edges2])
+
+            payload = b"[" + b",".join(nodes) + b"]"
+            pending.append(writer.submit(write_payload, graph_path, payload, True))
+            counts = (num_blocks0, num_blocks1, len(edges1), len(edges2))
+        prev_graphs[name] = (digest, graph_path, counts)
+        name_map[h] = name
+
+        snapshot_summary.append({
+            "name": name,
+            "num_blocks0": counts[0],
+            "num_blocks1": counts[1],
+            "num_edges0": counts[2],
+            "num_edges1": counts[3],
+            "execs0": fn1["nums_executed"] if fn1 else 0,
+            "execs1": fn2["nums_executed"] if fn2 else 0
+        })
+    # The next snapshot may hardlink these files, so they must be complete
+    for future in pending:
+        future.result()
+    # Write the mapping file for this snapshot
+    write_file(time_dir / "name_map.json", json_dumps(name_map))
+    write_file(time_dir / "name_to_hash.json", json_dumps({name: h for h, name in name_map.items()}))
+    remove_stale(time_dir, {f"{h}.json.gz" for h in name_map} | {"name_map.json", "name_to_hash.json"})
+    write_file(output_path / "snapshots" / f"{time1}.json", json_dumps(snapshot_summary))
+    return time1
+
+def process_comparison_snapshots(pairs: list[tuple[tuple[int, str], tuple[int, str]]], output_path: Path, writer_threads: int):
+    # Pairs in a batch are handled in order so unchanged graphs can be linked
+    prev_graphs = {}
+    with ThreadPoolExecutor(max_workers=writer_threads) as writer:
+        return [
+            process_comparison_snapshot(time1, file1, time2, file2, output_path, prev_graphs, writer)
+            for (time1, file1), (time2, file2) in pairs
+        ]
+
+def generate_comparison_report(input_dirs: list[str], output_dir: str, jobs: Optional[int] = None):
     input_paths = [Path(input_dir) for input_dir in input_dirs]
     output_path = Path(output_dir)
     graph_dir = output_path / "graphs"
+    snapshot_dir = output_path / "snapshots"
     css_dir = output_path / "css"
 
-    if output_path.exists():
-        shutil.rmtree(output_path)
-    output_path.mkdir()
-    graph_dir.mkdir()
-    css_dir.mkdir()
-
-    snapshots = []
-    times = []
-
-    files1 = sorted(
-        input_paths[0].glob("fun_coverage_*.json"),
-        key=lambda f: int(f.stem.split("_")[-1])
-    )
-
-    files2 = sorted(
-        input_paths[1].glob("fun_coverage_*.json"),
-        key=lambda f: int(f.stem.split("_")[-1])
-    )
-
-    for file1, file2 in zip(files1, files2):
-        time1 = int(file1.stem.split("_")[-1])
-        time2 = int(file2.stem.split("_")[-1])
-        if time1 != time2:
-            print(f"Error: Timestamp mismatch between files: {time1} != {time2}", file=sys.stderr)
-        with open(file1) as f1:
-            data1 = json.load(f1)
-        with open(file2) as f2:
-            data2 = json.load(f2)
-
-        # convert data1 and data2 to dicts of name -> fn
-        data1 = {fn["name"]: fn for fn in data1}
-        data2 = {fn["name"]: fn for fn in data2}
-
-        snapshot_summary = []
-        time_dir = graph_dir / str(time1)
-        time_dir.mkdir(parents=True, exist_ok=True)
-        name_map = {}
-        names = set(itertools.chain(data1.keys(), data2.keys()))
-        for name in names:
-            h = hash_name(name)
-            fn1 = data1.get(name)
-            fn2 = data2.get(name)
-            if fn1 is None:
-                blocks2 = {bid: count for bid, count in fn2["unique_blocks"]}
-                blocks1 = {bid: 0 for bid, _count in fn2["unique_blocks"]}
-            elif fn2 is None:
-                blocks1 = {bid: count for bid, count in fn1["unique_blocks"]}
-                blocks2 = {bid: 0 for bid, _count in fn1["unique_blocks"]}
-            else:
-                blocks1 = {bid: count for bid, count in fn1["unique_blocks"]}
-                blocks2 = {bid: count for bid, count in fn2["unique_blocks"]}
-            bids = set(blocks1.keys()) | set(blocks2.keys())
-            block_exec_map = dict()
-            for bid in bids:
-                count1 = blocks1.get(bid, 0)
-                count2 = blocks2.get(bid, 0)
-                block_exec_map[bid] = (count1, count2)
-
-            def node_color(bid):
-                execs0, execs1 = block_exec_map[bid]
-                if execs0 == 0 and execs1 == 0:
-                    return "#808080"
-                elif execs0 == 0:
-                    return "#2ECC40"
-                elif execs1 == 0:
-                    return "#FF4136"
-                else:
-                    return "#0000FF"
-            nodes = [{
-                "data": {
-                    "id": str(bid),
-                    "label": f"Block {bid}\nExecs: {block_exec_map[bid][0]} / {block_exec_map[bid][1]}",
-                    "execs0": int(block_exec_map[bid][0]),
-                    "execs1": int(block_exec_map[bid][1]),
-                    "color": node_color(bid)
-                }
-            } for bid in bids]
-            edges1 = { (src, dst) for src, dst in fn1["unique_edges"] if src in bids and dst in bids } if fn1 else set()
-            edges1.update({ (src, dst) for src, dst in fn1["hyper_edges"] if src in bids and dst in bids } if fn1 else set())
-            edges2 = { (src, dst) for src, dst in fn2["unique_edges"] if src in bids and dst in bids } if fn2 else set()
-            edges2.update({ (src, dst) for src, dst in fn2["hyper_edges"] if src in bids and dst in bids } if fn2 else set())
-            edges_1_only = edges1 - edges2
-            edges_2_only = edges2 - edges1
-            edges_both = edges1 & edges2
-            edges1_only = [{"data": {"source": str(src), "target": str(dst), "color": "#FF4136"}} for src, dst in edges_1_only]
-            edges2_only = [{"data": {"source": str(src), "target": str(dst), "color": "#2ECC40"}} for src, dst in edges_2_only]
-            edges_both = [
-                {"data": {"source": str(src), "target": str(dst), "color": "#0074D9"}}
-                for src, dst in edges_both
-            ]
-
-            (time_dir / f"{h}.json").write_text(json.dumps(nodes + edges1_only + edges2_only + edges_both, indent=2))
-            name_map[h] = name
-
-            snapshot_summary.append({
-                "name": name,
-                "num_blocks0": sum(1 for count in block_exec_map.values() if count[0] > 0),
-                "num_blocks1": sum(1 for count in block_exec_map.values() if count[1] > 0),
-                "num_edges0": len(edges1),
-                "num_edges1": len(edges2),
-                "execs0": fn1["nums_executed"] if fn1 else 0,
-                "execs1": fn2["nums_executed"] if fn2 else 0
-            })
-        # Write the mapping file for this snapshot
-        (time_dir / "name_map.json").write_text(json.dumps(name_map, indent=2, ensure_ascii=False))
-
-        snapshots.append(snapshot_summary)
-        times.append(time1)
-
-    (output_path / "index.html").write_text(Template(INDEX_HTML_TEMPLATE2).render(
-        snapshots_json=json.dumps(snapshots, ensure_ascii=False),
+    # Overwrite in place and sweep leftovers afterwards instead of deleting the whole tree
+    for directory in (output_path, graph_dir, snapshot_dir, css_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+    # Anything else, including a time-series graph cache, was left by another report type
+    remove_stale(output_path, {"graphs", "snapshots", "css", "index.html", "function.html", "times.js"})
+
+    files1 = list_snapshot_files(input_paths[0])
+    files2 = list_snapshot_files(input_paths[1])
+
+    pairs = list(zip(files1, files2))
+    batches = split_batches(pairs, jobs or os.cpu_count() or 1)
+    # gzip is CPU bound, split the writer threads between the worker processes
+    writer_threads = max(1, WRITER_THREADS // max(1, len(batches)))
+    with ProcessPoolExecutor(max_workers=len(batches) or None) as executor:
+        times = list(itertools.chain.from_iterable(
+            executor.map(process_comparison_snapshots, batches, itertools.repeat(output_path), itertools.repeat(writer_threads))
+        ))
+    remove_stale(graph_dir, {str(time) for time in times})
+    remove_stale(snapshot_dir, {f"{time}.json" for time in times})
+
+    write_if_changed(output_path / "index.html", INDEX_TEMPLATE2.render(
         times=times,
         max_idx=len(times) - 1
-    ))
-    (output_path / "function.html").write_text(FUNCTION_HTML_TEMPLATE2)
-    (css_dir / "style.css").write_text(STYLE_CSS)
-    (output_path / "times.js").write_text("const times = " + json.dumps(times) + ";")
+    ).encode())
+    write_if_changed(output_path / "function.html", FUNCTION_HTML_TEMPLATE2.encode())
+    write_if_changed(css_dir / "style.css", STYLE_CSS.encode())
+    write_if_changed(output_path / "times.js", b"const times = " + json_dumps(times) + b";")
     print(f"✅ Time-series report generated at: {output_path.resolve()}")
 
 INDEX_HTML_TEMPLATE2 = """
@@ -494,6 +726,9 @@ INDEX_HTML_TEMPLATE2 = """
     <meta charset="utf-8">
     <title>Coverage Report (Comparison)</title>
     <link rel="stylesheet" href="css/style.css">
+    <link rel="stylesheet" type="text/css" href="https://cdn.datatables.net/1.13.7/css/jquery.dataTables.css">
+    <script type="text/javascript" src="https://code.jquery.com/jquery-3.7.0.min.js"></script>
+    <script type="text/javascript" src="https://cdn.datatables.net/1.13.7/js/jquery.dataTables.js"></script>
 </head>
 <body>
 <h1>Coverage Summary (Comparison)</h1>
@@ -520,64 +755,85 @@ INDEX_HTML_TEMPLATE2 = """
 </div>
 
 <script>
-const snapshots = {{ snapshots_json | safe }};
 const times = {{ times | safe }};
+const SNAPSHOT_CACHE_SIZE = 32;
+const snapshotCache = new Map();
+let dataTable;
+let currentIdx = 0;
+
+function valOrDash(val) { return val === null || val === undefined ? '—' : val; }
+
+function escapeHtml(text) {
+    return text.replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]));
+}
+
+function fetchSnapshot(idx) {
+    let snapshot = snapshotCache.get(idx);
+    if (snapshot) {
+        // Move to the back so the least recently used entry is evicted first
+        snapshotCache.delete(idx);
+    } else {
+        snapshot = fetch("snapshots/" + times[idx] + ".json")
+            .then(resp => resp.json())
+            .catch(err => {
+                snapshotCache.delete(idx);
+                throw err;
+            });
+    }
+    snapshotCache.set(idx, snapshot);
+    if (snapshotCache.size > SNAPSHOT_CACHE_SIZE) {
+        snapshotCache.delete(snapshotCache.keys().next().value);
+    }
+    return snapshot;
+}
 
 function loadSnapshot(idx) {
-    const tbody = document.getElementById('table-body');
-    tbody.innerHTML = '';
+    currentIdx = idx;
+    fetchSnapshot(idx).then(snapshot => {
+        // Ignore responses for positions the slider has already left
+        if (idx === currentIdx) renderSnapshot(idx, snapshot);
+    });
+    if (idx > 0) fetchSnapshot(idx - 1);
+    if (idx < times.length - 1) fetchSnapshot(idx + 1);
+}
+
+function renderSnapshot(idx, snapshot) {
+    if (!dataTable) {
+        dataTable = $('#coverage-table').DataTable({
+            order: [[0, 'asc']], // Sort by function name by default
+            pageLength: 25,
+            lengthMenu: [[10, 25, 50, -1], [10, 25, 50, "All"]],
+            columnDefs: [
+                { targets: 0, type: 'string' },
+                { targets: [1, 2, 3, 4, 5, 6], type: 'num' }
+            ]
+        });
+    }
+    dataTable.clear();
 
-    const snapshot = snapshots[idx];
     if (!snapshot || snapshot.length === 0) {
-        const tr = document.createElement('tr');
-        const td = document.createElement('td');
-        td.colSpan = 7;
-        td.textContent = "No functions in this snapshot";
-        tr.appendChild(td);
-        tbody.appendChild(tr);
+        dataTable.row.add(['No functions in this snapshot', '', '', '', '', '', '']).draw(false);
         return;
     }
 
+    // Hand all rows to DataTables at once instead of building the tbody by hand
+    const rows = [];
     for (const fn of snapshot) {
         if (!fn || !fn.name) continue;
-
-        const tr = document.createElement('tr');
-        const a = document.createElement('a');
-        a.href = `function.html?name=${encodeURIComponent(fn.name)}&t=${times[idx]}`;
-        a.textContent = fn.name;
-        a.title = fn.name;
-        const tdName = document.createElement('td');
-        tdName.appendChild(a);
-
-        function valOrDash(val) { return val === null || val === undefined ? '—' : val; }
-
-        const tdBlocks1 = document.createElement('td');
-        tdBlocks1.textContent = valOrDash(fn.num_blocks0);
-
-        const tdBlocks2 = document.createElement('td');
-        tdBlocks2.textContent = valOrDash(fn.num_blocks1);
-
-        const tdEdges1 = document.createElement('td');
-        tdEdges1.textContent = valOrDash(fn.num_edges0);
-
-        const tdEdges2 = document.createElement('td');
-        tdEdges2.textContent = valOrDash(fn.num_edges1);
-
-        const tdExecs1 = document.createElement('td');
-        tdExecs1.textContent = valOrDash(fn.execs0);
-
-        const tdExecs2 = document.createElement('td');
-        tdExecs2.textContent = valOrDash(fn.execs1);
-
-        tr.appendChild(tdName);
-        tr.appendChild(tdBlocks1);
-        tr.appendChild(tdBlocks2);
-        tr.appendChild(tdEdges1);
-        tr.appendChild(tdEdges2);
-        tr.appendChild(tdExecs1);
-        tr.appendChild(tdExecs2);
-        tbody.appendChild(tr);
+        const name = escapeHtml(fn.name);
+        rows.push([
+            `<a href="function.html?name=${encodeURIComponent(fn.name)}&t=${times[idx]}" title="${name}">${name}</a>`,
+            valOrDash(fn.num_blocks0),
+            valOrDash(fn.num_blocks1),
+            valOrDash(fn.num_edges0),
+            valOrDash(fn.num_edges1),
+            valOrDash(fn.execs0),
+            valOrDash(fn.execs1)
+        ]);
     }
+
+    // Draw and preserve current page
+    dataTable.rows.add(rows).draw(false);
 }
 
 document.getElementById('time-slider').addEventListener('input', function () {
@@ -594,6 +850,8 @@ window.addEventListener('DOMContentLoaded', () => {
 </html>
 """
 
+INDEX_TEMPLATE2 = Template(INDEX_HTML_TEMPLATE2)
+
 FUNCTION_HTML_TEMPLATE2 = """
 <!DOCTYPE html>
 <html>
@@ -632,77 +890,97 @@ if (currentIndex === -1) currentIndex = 0;
 slider.value = currentIndex;
 label.textContent = times[currentIndex];
 
+const LAYOUT = {
+    name: 'dagre',
+    rankDir: 'TB',
+    nodeSep: 70,
+    edgeSep: 30,
+    rankSep: 100
+};
+let cy = null;
+let latestLoad = 0;
+
+// Graphs are stored gzipped, decompress them unless the server already did
+async function fetchGzipJson(url) {
+    const buf = new Uint8Array(await (await fetch(url)).arrayBuffer());
+    if (buf[0] !== 0x1f || buf[1] !== 0x8b) {
+        return JSON.parse(new TextDecoder().decode(buf));
+    }
+    const stream = new Blob([buf]).stream().pipeThrough(new DecompressionStream("gzip"));
+    return new Response(stream).json();
+}
+
 function loadGraph(name, t) {
+    const load = ++latestLoad;
     const graphDir = "graphs/" + t + "/";
-    const nameMapUrl = graphDir + "name_map.json";
-    fetch(nameMapUrl)
+    fetch(graphDir + "name_to_hash.json")
         .then(resp => resp.json())
-        .then(nameMap => {
-            // Find the hash for this function name
-            let hash = null;
-            for (const [h, original] of Object.entries(nameMap)) {
-                if (original === name) {
-                    hash = h;
-                    break;
-                }
-            }
+        .then(nameToHash => {
+            const hash = Object.hasOwn(nameToHash, name) ? nameToHash[name] : null;
             if (!hash) {
                 alert("Function not found in mapping!");
                 throw new Error("Function not found in mapping");
             }
-            return fetch(graphDir + hash + ".json");
+            return fetchGzipJson(graphDir + hash + ".json.gz");
         })
-        .then(response => response.json())
         .then(data => {
+            // A newer timestamp was requested while this one loaded
+            if (load !== latestLoad) return;
             document.getElementById("title").innerText = name + " @ t=" + t;
-            cytoscape({
-                container: document.getElementById('cy'),
-                elements: data,
-                layout: {
-                    name: 'dagre',
-                    rankDir: 'TB',
-                    nodeSep: 70,
-                    edgeSep: 30,
-                    rankSep: 100
-                },
-                style: [
-                    {
-                        selector: 'node',
-                        style: {
-                            'label': 'data(label)',
-                            'background-color': 'data(color)',
-                            'color': '#fff',
-                            'text-valign': 'center',
-                            'text-halign': 'center',
-                            'text-wrap': 'wrap',
-                            'text-max-width': 80,
-                            'font-size': '10px',
-                            'padding': '6px',
-                            'shape': 'roundrectangle',
-                            'width': 'label',
-                            'height': 'label'
-                        }
-                    },
-                    {
-                        selector: 'edge',
-                        style: {
-                            'width': 2,
-                            'line-color': 'data(color)',
-                            'target-arrow-shape': 'triangle',
-                            'target-arrow-color': 'data(color)',
-                            'curve-style': 'bezier'
+            if (!cy) {
+                cy = cytoscape({
+                    container: document.getElementById('cy'),
+                    elements: data,
+                    layout: LAYOUT,
+                    style: [
+                        {
+                            selector: 'node',
+                            style: {
+                                'label': 'data(label)',
+                                'background-color': 'data(color)',
+                                'color': '#fff',
+                                'text-valign': 'center',
+                                'text-halign': 'center',
+                                'text-wrap': 'wrap',
+                                'text-max-width': 80,
+                                'font-size': '10px',
+                                'padding': '6px',
+                                'shape': 'roundrectangle',
+                                'width': 'label',
+                                'height': 'label'
+                            }
+                        },
+                        {
+                            selector: 'edge',
+                            style: {
+                                'width': 2,
+                                'line-color': 'data(color)',
+                                'target-arrow-shape': 'triangle',
+                                'target-arrow-color': 'data(color)',
+                                'curve-style': 'bezier'
+                            }
                         }
-                    }
-                ]
-            });
+                    ]
+                });
+            } else {
+                // Reuse the instance so styles are not recompiled on every tick
+                cy.batch(() => {
+                    cy.elements().remove();
+                    cy.add(data);
+                });
+                cy.layout(LAYOUT).run();
+            }
         });
 }
 
+let sliderTimer = null;
 slider.addEventListener("input", () => {
     const idx = parseInt(slider.value);
     const newTime = times[idx];
     label.textContent = newTime;
-    loadGraph(name, newTime);
+    // Coalesce the ticks fired while the slider is dragged
+    clearTimeout(sliderTimer);
+    sliderTimer = setTimeout(() => loadGraph(name, newTime), 150);
 });
 
 window.addEventListener("DOMContentLoaded", () => {
@@ -750,63 +1028,133 @@ if (currentIndex === -1) currentIndex = 0;
 slider.value = currentIndex;
 label.textContent = times[currentIndex];
 
+const LAYOUT = {
+    name: 'dagre',
+    rankDir: 'LR',
+    nodeSep: 100,
+    edgeSep: 50,
+    rankSep: 150
+};
+let cy = null;
+let latestLoad = 0;
+const BINARY = {{ 'true' if binary else 'false' }};
+const COLORS = ["#808080", "#2ECC40", "#FF4136", "#0074D9"];
+
+// Mirrors pack_call_graph in gen_cov.py
+function decodeCallGraph(bytes) {
+    const decoder = new TextDecoder();
+    let pos = 4;
+    function varint() {
+        let value = 0;
+        let scale = 1;
+        let b;
+        do {
+            b = bytes[pos++];
+            value += (b & 0x7f) * scale;
+            scale *= 128;
+        } while (b & 0x80);
+        return value;
+    }
+    const elements = [];
+    const nodeCount = varint();
+    let id = 0;
+    for (let i = 0; i < nodeCount; i++) {
+        id += varint();
+        const execs1 = varint();
+        const execs2 = varint();
+        const color = COLORS[bytes[pos++]];
+        const len = varint();
+        const name = decoder.decode(bytes.subarray(pos, pos + len));
+        pos += len;
+        elements.push({ data: { id: id, label: name + "\\nExecs: " + execs1 + " / " + execs2, color: color } });
+    }
+    const edgeCount = varint();
+    let src = 0;
+    let dst = 0;
+    for (let i = 0; i < edgeCount; i++) {
+        const srcDelta = varint();
+        src += srcDelta;
+        dst = srcDelta === 0 ? dst + varint() : varint();
+        elements.push({ data: { source: src, target: dst, color: COLORS[bytes[pos++]] } });
+    }
+    return elements;
+}
+
+// Graphs are stored gzipped, decompress them unless the server already did
+async function fetchGzipBytes(url) {
+    const buf = new Uint8Array(await (await fetch(url)).arrayBuffer());
+    if (buf[0] !== 0x1f || buf[1] !== 0x8b) {
+        return buf;
+    }
+    const stream = new Blob([buf]).stream().pipeThrough(new DecompressionStream("gzip"));
+    return new Uint8Array(await new Response(stream).arrayBuffer());
+}
+
 function loadGraph(t) {
-    const graphDir = "graphs/" + t + "/";
-    fetch(graphDir + "call_graph.json")
-        .then(response => response.json())
+    const load = ++latestLoad;
+    fetchGzipBytes("graphs/" + t + (BINARY ? ".bin.gz" : ".json.gz"))
+        .then(bytes => BINARY ? decodeCallGraph(bytes) : JSON.parse(new TextDecoder().decode(bytes)))
         .then(data => {
+            // A newer timestamp was requested while this one loaded
+            if (load !== latestLoad) return;
             document.getElementById("title").innerText = "Call Graph Comparison @ t=" + t;
-            cytoscape({
-                container: document.getElementById('cy'),
-                elements: data,
-                layout: {
-                    name: 'dagre',
-                    rankDir: 'LR',
-                    nodeSep: 100,
-                    edgeSep: 50,
-                    rankSep: 150
-                },
-                style: [
-                    {
-                        selector: 'node',
-                        style: {
-                            'label': 'data(label)',
-                            'background-color': 'data(color)',
-                            'color': '#fff',
-                            'text-valign': 'center',
-                            'text-halign': 'center',
-                            'text-wrap': 'wrap',
-                            'text-max-width': 120,
-                            'font-size': '12px',
-                            'padding': '8px',
-                            'shape': 'roundrectangle',
-                            'width': 'label',
-                            'height': 'label'
+            if (!cy) {
+                cy = cytoscape({
+                    container: document.getElementById('cy'),
+                    elements: data,
+                    layout: LAYOUT,
+                    style: [
+                        {
+                            selector: 'node',
+                            style: {
+                                'label': 'data(label)',
+                                'background-color': 'data(color)',
+                                'color': '#fff',
+                                'text-valign': 'center',
+                                'text-halign': 'center',
+                                'text-wrap': 'wrap',
+                                'text-max-width': 120,
+                                'font-size': '12px',
+                                'padding': '8px',
+                                'shape': 'roundrectangle',
+                                'width': 'label',
+                                'height': 'label'
+                            }
+                        },
+                        {
+                            selector: 'edge',
+                            style: {
+                                'width': 2,
+                                'line-color': 'data(color)',
+                                'target-arrow-shape': 'triangle',
+                                'target-arrow-color': 'data(color)',
+                                'curve-style': 'bezier',
+                                'label': 'data(label)',
+                                'font-size': '10px',
+                                'text-rotation': 'autorotate'
+                            }
                         }
-                    },
-                    {
-                        selector: 'edge',
-                        style: {
-                            'width': 2,
-                            'line-color': 'data(color)',
-                            'target-arrow-shape': 'triangle',
-                            'target-arrow-color': 'data(color)',
-                            'curve-style': 'bezier',
-                            'label': 'data(label)',
-                            'font-size': '10px',
-                            'text-rotation': 'autorotate'
-                        }
-                    }
-                ]
-            });
+                    ]
+                });
+            } else {
+                // Reuse the instance so styles are not recompiled on every tick
+                cy.batch(() => {
+                    cy.elements().remove();
+                    cy.add(data);
+                });
+                cy.layout(LAYOUT).run();
+            }
         });
 }
 
+let sliderTimer = null;
 slider.addEventListener("input", () => {
     const idx = parseInt(slider.value);
     const newTime = times[idx];
     label.textContent = newTime;
-    loadGraph(newTime);
+    // Coalesce the ticks fired while the slider is dragged
+    clearTimeout(sliderTimer);
+    sliderTimer = setTimeout(() => loadGraph(newTime), 150);
 });
 
 window.addEventListener("DOMContentLoaded", () => {
@@ -817,133 +1165,173 @@ window.addEventListener("DOMContentLoaded", () => {
 </html>
 """
 
-def generate_call_graph_report(input_dirs: list[str], output_dir: str):
+CALL_GRAPH_TEMPLATE = Template(CALL_GRAPH_HTML_TEMPLATE)
+
+# Node and edge colours, the binary format stores the index into this tuple
+CALL_GRAPH_COLORS = ("#808080", "#2ECC40", "#FF4136", "#0074D9")
+GRAY, GREEN, RED, BLUE = range(len(CALL_GRAPH_COLORS))
+CALL_GRAPH_MAGIC = b"CGB1"
+CALL_GRAPH_COLOR_BYTES = tuple(color.encode() for color in CALL_GRAPH_COLORS)
+CALL_GRAPH_NODE_JSON = b'{"data":{"id":%d,"label":%s,"color":"%s"}}'
+CALL_GRAPH_EDGE_JSON = b'{"data":{"source":%d,"target":%d,"color":"%s"}}'
+
+def encode_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def pack_call_graph(node_rows: list[tuple], edge_rows: list[tuple]) -> bytes:
+    # Node ids and edge sources are delta coded in sorted order, targets too while the source repeats
+    out = bytearray(CALL_GRAPH_MAGIC)
+    encode_varint(out, len(node_rows))
+    prev_id = 0
+    for id, name, execs1, execs2, color in sorted(node_rows):
+        encode_varint(out, id - prev_id)
+        prev_id = id
+        encode_varint(out, execs1)
+        encode_varint(out, execs2)
+        out.append(color)
+        encoded = name.encode("utf-8")
+        encode_varint(out, len(encoded))
+        out += encoded
+    encode_varint(out, len(edge_rows))
+    prev_src = prev_dst = 0
+    for src, dst, color in sorted(edge_rows):
+        encode_varint(out, src - prev_src)
+        encode_varint(out, dst - prev_dst if src == prev_src else dst)
+        prev_src, prev_dst = src, dst
+        out.append(color)
+    return bytes(out)
+
+def process_call_graph_snapshot(time1: int, file1: str, time2: int, file2: str, graph_dir: Path, binary: bool, prev_calls: dict, prev_graph: Optional[tuple]):
+    if time1 != time2:
+        print(f"Error: Timestamp mismatch between files: {time1} != {time2}", file=sys.stderr)
+    with open(file1, "rb") as f1:
+        data1 = json_loads(f1.read())
+    with open(file2, "rb") as f2:
+        data2 = json_loads(f2.read())
+
+    # Convert data1 and data2 to dicts of name -> fn
+    data1 = {fn["id"]: fn for fn in data1}
+    data2 = {fn["id"]: fn for fn in data2}
+
+    # Rows for all functions and calls, turned into JSON elements or packed at the end
+    node_rows = []
+    edge_rows = []
+    all_function_ids = data1.keys() | data2.keys()
+
+    for id in all_function_ids:
+        fn1 = data1.get(id)
+        fn2 = data2.get(id)
+
+        # Determine node color based on execution counts
+        if fn1 is None:
+            execs1 = 0
+            execs2 = fn2["nums_executed"]
+            color = GREEN  # Only in fuzzer 2
+            name = fn2["name"]
+        elif fn2 is None:
+            execs1 = fn1["nums_executed"]
+            execs2 = 0
+            color = RED  # Only in fuzzer 1
+            name = fn1["name"]
+        else:
+            execs1 = fn1["nums_executed"]
+            execs2 = fn2["nums_executed"]
+            name = fn1["name"]
+            if fn1["name"] != fn2["name"]:
+                print(f"Error: Function Name mismatch between files: {fn1['name']} != {fn2['name']}", file=sys.stderr)
+            if execs1 == 0 and execs2 == 0:
+                color = GRAY  # Not executed in either
+            elif execs1 == 0:
+                color = GREEN  # Only executed in fuzzer 2
+            elif execs2 == 0:
+                color = RED  # Only executed in fuzzer 1
+            else:
+                color = BLUE  # Executed in both
+        node_rows.append((id, name, execs1, execs2, color))
+
+        calls1 = fn1["calls"] if fn1 else ()
+        calls2 = fn2["calls"] if fn2 else ()
+        if not calls1 and not calls2:
+            # Leaf function in both runs, there are no edges to colour
+            continue
+        prev = prev_calls.get(id)
+        if prev is not None and prev[0] == calls1 and prev[1] == calls2:
+            # Same calls on both sides as the previous snapshot
+            rows = prev[2]
+        else:
+            # One entry per callee, upgraded to blue when fuzzer 2 makes a call fuzzer 1 made too
+            edge_colors = dict.fromkeys(calls1, RED)  # Red for fuzzer 1
+            for callee in calls2:
+                color = edge_colors.get(callee)
+                if color is None:
+                    edge_colors[callee] = GREEN  # Green for fuzzer 2
+                elif color == RED:
+                    edge_colors[callee] = BLUE  # Blue for both
+            rows = [(id, callee, color) for callee, color in edge_colors.items()]
+            prev_calls[id] = (calls1, calls2, rows)
+        edge_rows.extend(rows)
+
+    # One file per timestamp directly under graphs/, there is nothing else to group with it
+    graph_path = graph_dir / (f"{time1}.bin.gz" if binary else f"{time1}.json.gz")
+    graph = (node_rows, edge_rows, graph_path)
+    if prev_graph is not None and prev_graph[:2] == graph[:2] and try_link(prev_graph[2], graph_path):
+        # Nothing changed since the previous snapshot, reuse its file
+        return graph
+    if binary:
+        write_payload(graph_path, pack_call_graph(node_rows, edge_rows), True)
+        return graph
+    # Only the label holds arbitrary text, it is the one value that goes through the encoder
+    elements = [
+        CALL_GRAPH_NODE_JSON % (id, json_dumps(f"{name}\nExecs: {execs1} / {execs2}"), CALL_GRAPH_COLOR_BYTES[color])
+        for id, name, execs1, execs2, color in node_rows
+    ]
+    elements.extend([CALL_GRAPH_EDGE_JSON % (src, dst, CALL_GRAPH_COLOR_BYTES[color]) for src, dst, color in edge_rows])
+    write_payload(graph_path, b"[" + b",".join(elements) + b"]", True)
+    return graph
+
+def process_call_graph_snapshots(pairs: list[tuple[tuple[int, str], tuple[int, str]]], graph_dir: Path, binary: bool):
+    # Pairs in a batch are handled in order so unchanged edges and graphs can be reused
+    prev_calls = {}
+    prev_graph = None
+    times = []
+    for (time1, file1), (time2, file2) in pairs:
+        prev_graph = process_call_graph_snapshot(time1, file1, time2, file2, graph_dir, binary, prev_calls, prev_graph)
+        times.append(time1)
+    return times
+
+def generate_call_graph_report(input_dirs: list[str], output_dir: str, jobs: Optional[int] = None, binary: bool = False):
     input_paths = [Path(input_dir) for input_dir in input_dirs]
     output_path = Path(output_dir)
     graph_dir = output_path / "graphs"
     css_dir = output_path / "css"
 
-    if output_path.exists():
-        shutil.rmtree(output_path)
-    output_path.mkdir()
-    graph_dir.mkdir()
-    css_dir.mkdir()
+    for directory in (output_path, graph_dir, css_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+    # Anything else was left by another report type
+    remove_stale(output_path, {"graphs", "css", "call_graph.html", "times.js"})
 
-    times = []
+    files1 = list_snapshot_files(input_paths[0])
+    files2 = list_snapshot_files(input_paths[1])
 
-    files1 = sorted(
-        input_paths[0].glob("fun_coverage_*.json"),
-        key=lambda f: int(f.stem.split("_")[-1])
-    )
-
-    files2 = sorted(
-        input_paths[1].glob("fun_coverage_*.json"),
-        key=lambda f: int(f.stem.split("_")[-1])
-    )
-
-    for file1, file2 in zip(files1, files2):
-        time1 = int(file1.stem.split("_")[-1])
-        time2 = int(file2.stem.split("_")[-1])
-        if time1 != time2:
-            print(f"Error: Timestamp mismatch between files: {time1} != {time2}", file=sys.stderr)
-        with open(file1) as f1:
-            data1 = json.load(f1)
-        with open(file2) as f2:
-            data2 = json.load(f2)
-
-        # Convert data1 and data2 to dicts of name -> fn
-        data1 = {fn["id"]: fn for fn in data1}
-        data2 = {fn["id"]: fn for fn in data2}
-
-        time_dir = graph_dir / str(time1)
-        time_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create nodes for all functions
-        nodes = []
-        edges = []
-        all_function_ids = set(itertools.chain(data1.keys(), data2.keys()))
-
-        for id in all_function_ids:
-            fn1 = data1.get(id)
-            fn2 = data2.get(id)
-            
-            # Determine node color based on execution counts
-            if fn1 is None:
-                execs1 = 0
-                execs2 = fn2["nums_executed"]
-                color = "#2ECC40"  # Green - only in fuzzer 2
-                name = fn2["name"]
-            elif fn2 is None:
-                execs1 = fn1["nums_executed"]
-                execs2 = 0
-                color = "#FF4136"  # Red - only in fuzzer 1
-                name = fn1["name"]
-            else:
-                execs1 = fn1["nums_executed"]
-                execs2 = fn2["nums_executed"]
-                name = fn1["name"]
-                if fn1["name"] != fn2["name"]:
-                    print(f"Error: Function Name mismatch between files: {fn1['name']} != {fn2['name']}", file=sys.stderr)
-                if execs1 == 0 and execs2 == 0:
-                    color = "#808080"  # Gray - not executed in either
-                elif execs1 == 0:
-                    color = "#2ECC40"  # Green - only executed in fuzzer 2
-                elif execs2 == 0:
-                    color = "#FF4136"  # Red - only executed in fuzzer 1
-                else:
-                    color = "#0074D9"  # Blue - executed in both
-
-            nodes.append({
-                "data": {
-                    "id": id,
-                    "label": f"{name}\nExecs: {execs1} / {execs2}",
-                    "color": color
-                }
-            })
-
-            edges1 = set()
-            if fn1:
-                for callee in fn1["calls"]:
-                    edges1.add((fn1["id"], callee))
-            edges2 = set()
-            if fn2:
-                for callee in fn2["calls"]:
-                    edges2.add((fn2["id"], callee))
-            for edge in edges1 - edges2:
-                edges.append({
-                    "data": {
-                        "source": edge[0],
-                        "target": edge[1],
-                        "color": "#FF4136",  # Red for fuzzer 1
-                    }
-                })
-            for edge in edges1 & edges2:
-                edges.append({
-                    "data": {
-                        "source": edge[0],
-                        "target": edge[1],
-                        "color": "#0074D9",  # Blue for both
-                    }
-                })
-            for edge in edges2 - edges1:
-                edges.append({
-                    "data": {
-                        "source": edge[0],
-                        "target": edge[1],
-                        "color": "#2ECC40",  # Green for fuzzer 2
-                    }
-                })
-            
-        # Write the call graph for this timestamp
-        (time_dir / "call_graph.json").write_text(json.dumps(nodes + edges, indent=2))
-        times.append(time1)
+    pairs = list(zip(files1, files2))
+    batches = split_batches(pairs, jobs or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=len(batches) or None) as executor:
+        times = list(itertools.chain.from_iterable(
+            executor.map(process_call_graph_snapshots, batches, itertools.repeat(graph_dir), itertools.repeat(binary))
+        ))
+    suffix = ".bin.gz" if binary else ".json.gz"
+    remove_stale(graph_dir, {f"{time}{suffix}" for time in times})
 
-    (output_path / "call_graph.html").write_text(Template(CALL_GRAPH_HTML_TEMPLATE).render(
+    write_if_changed(output_path / "call_graph.html", CALL_GRAPH_TEMPLATE.render(
         times=times,
-        max_idx=len(times) - 1
-    ))
-    (css_dir / "style.css").write_text(STYLE_CSS)
-    (output_path / "times.js").write_text("const times = " + json.dumps(times) + ";")
+        max_idx=len(times) - 1,
+        binary=binary
+    ).encode())
+    write_if_changed(css_dir / "style.css", STYLE_CSS.encode())
+    write_if_changed(output_path / "times.js", b"const times = " + json_dumps(times) + b";")
     print(f"✅ Call graph comparison report generated at: {output_path.resolve()}")
 
 if __name__ == "__main__":
@@ -951,10 +1339,12 @@ if __name__ == "__main__":
     parser.add_argument("input_dirs", nargs='+', help="One or two directories containing fun_coverage_*.json files")
     parser.add_argument("output", help="Directory to write the report to")
     parser.add_argument("--call-graph", action="store_true", help="Generate call graph comparison report")
+    parser.add_argument("--jobs", type=int, help="Number of worker processes (default: number of CPUs)")
+    parser.add_argument("--binary", action="store_true", help="Write call graphs in a compact varint format instead of JSON")
     args = parser.parse_args()
     if len(args.input_dirs) == 1:
-        generate_time_series_report(args.input_dirs[0], args.output)
+        generate_time_series_report(args.input_dirs[0], args.output, args.jobs)
     elif args.call_graph:
-        generate_call_graph_report(args.input_dirs, args.output)
+        generate_call_graph_report(args.input_dirs, args.output, args.jobs, args.binary)
     else:
-        generate_comparison_report(args.input_dirs, args.output)
+        generate_comparison_report(args.input_dirs, args.output, args.jobs)